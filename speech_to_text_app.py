@@ -1,40 +1,419 @@
 # Fixed PyQt5 Speech-to-Text App
-# Requirements: pip install PyQt5 speechrecognition pyaudio pyperclip
+# Requirements: pip install PyQt5 speechrecognition pyaudio numpy requests orjson
 
 import sys
 import json
 import os
+import queue
 import threading
-import speech_recognition as sr
-import pyperclip
+from concurrent.futures import Future, ThreadPoolExecutor
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from PyQt5 import sip
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Speech stack, imported in the background by main() while Qt starts up
+np = None
+sr = None
+requests = None
+google_api = None
+http_session = None
+
+def import_speech_modules():
+    """Import the heavy speech modules"""
+    global np, sr, requests, google_api, http_session
+    import numpy
+    import speech_recognition
+    import speech_recognition.recognizers.google
+    import pyaudio
+    import requests as requests_module
+    np = numpy
+    sr = speech_recognition
+    requests = requests_module
+    google_api = speech_recognition.recognizers.google
+    
+    # One keep-alive connection for every phrase instead of a new one per request
+    http_session = requests.Session()
+
+def encode_flac(audio):
+    """FLAC-encode a phrase the way recognize_google uploads it"""
+    return audio.get_flac_data(convert_rate=google_api.RequestBuilder.to_convert_rate(audio.sample_rate), convert_width=2)
+
+def recognize_google(audio, language, timeout=None, flac_data=None):
+    """Same as Recognizer.recognize_google, but over the shared HTTP session"""
+    builder = google_api.create_request_builder(language=language)
+    if flac_data is None:
+        flac_data = encode_flac(audio)
+    try:
+        response = http_session.post(builder.build_url(), data=flac_data,
+                                     headers=builder.build_headers(audio), timeout=timeout or RECOGNITION_TIMEOUT)
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        raise sr.RequestError(f"recognition request failed: {e.response.reason}")
+    except requests.RequestException as e:
+        raise sr.RequestError(f"recognition connection failed: {e}")
+    
+    parser = google_api.OutputParser(show_all=False, with_confidence=False)
+    return parser.parse(response.content.decode("utf-8"))
+
+# Application-wide stylesheet, parsed once by Qt. Widgets are targeted by
+# object name and the record button switches look via its "recording" property.
+APP_STYLESHEET = """
+    QMainWindow {
+        background: #1e1e1e;
+        border-radius: 12px;
+    }
+    QWidget {
+        background: #1e1e1e;
+        color: white;
+        font-family: 'Segoe UI';
+    }
+    QLabel#titleLabel {
+        font-size: 14px;
+        font-weight: bold;
+        color: white;
+    }
+    QLabel#statusLabel {
+        background: rgba(0, 123, 255, 0.2);
+        border: 1px solid #007bff;
+        border-radius: 8px;
+        padding: 10px;
+        color: #007bff;
+        font-weight: 500;
+    }
+    QLabel#wordCount {
+        color: #adb5bd;
+        font-size: 11px;
+    }
+    QPushButton#recordBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                   stop:0 #28a745, stop:1 #20c997);
+        border: none;
+        border-radius: 35px;
+        color: white;
+        font-size: 28px;
+    }
+    QPushButton#recordBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                   stop:0 #218838, stop:1 #1c7431);
+    }
+    QPushButton#recordBtn[recording="true"] {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                   stop:0 #dc3545, stop:1 #c82333);
+    }
+    QPushButton#recordBtn[recording="true"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                   stop:0 #c82333, stop:1 #bd2130);
+    }
+    QPushButton#stopBtn {
+        background: #6c757d;
+        border: none;
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+    }
+    QPushButton#stopBtn:hover:enabled {
+        background: #5a6268;
+    }
+    QPushButton#stopBtn:disabled {
+        background: #495057;
+        color: #adb5bd;
+    }
+    QPushButton#toolBtn {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+    }
+    QPushButton#toolBtn:hover {
+        background: rgba(255, 255, 255, 0.2);
+    }
+    QPushButton#smallBtn {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 12px;
+        color: white;
+        font-size: 10px;
+    }
+    QPushButton#smallBtn:hover {
+        background: rgba(255, 255, 255, 0.2);
+    }
+    QPushButton#closeBtn {
+        background: #dc3545;
+        border: none;
+        border-radius: 12px;
+        color: white;
+        font-size: 10px;
+        font-weight: bold;
+    }
+    QPushButton#closeBtn:hover {
+        background: #c82333;
+    }
+    QTextEdit#textArea {
+        background: #2d2d2d;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 12px;
+        color: white;
+        font-size: 12px;
+    }
+    QTextEdit#textArea:focus {
+        border: 1px solid #007bff;
+    }
+    QDialog#settingsDialog {
+        background: #2d2d2d;
+        color: white;
+    }
+    QLabel#dialogTitle {
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QDialog#settingsDialog QCheckBox {
+        color: white;
+        spacing: 8px;
+    }
+    QDialog#settingsDialog QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid #666;
+        border-radius: 3px;
+    }
+    QDialog#settingsDialog QCheckBox::indicator:checked {
+        background: #007bff;
+        border: 2px solid #007bff;
+    }
+    QDialog#settingsDialog QPushButton {
+        background: #007bff;
+        border: none;
+        border-radius: 6px;
+        color: white;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QDialog#settingsDialog QPushButton:hover {
+        background: #0056b3;
+    }
+"""
+
+# Cloud recognizers downsample to 16 kHz mono anyway, so capture at that rate
+SAMPLE_RATE = 16000
+CHUNK_SIZE = 1024
+
+# Phrases waiting for recognition are capped at ~30 s of audio (~1 MB)
+PHRASE_TIME_LIMIT = 8
+MAX_BUFFERED_SECONDS = 30
+MAX_QUEUED_PHRASES = MAX_BUFFERED_SECONDS // PHRASE_TIME_LIMIT
+
+# Upper bounds so a slow network can't keep a stopped session (or the app) alive
+RECOGNITION_TIMEOUT = 10
+WORKER_SHUTDOWN_MS = 2000
+
+# Voice-activity gate applied before a phrase is sent for recognition
+VAD_FRAME_MS = 30
+VAD_MIN_VOICED_FRAMES = 3
+VAD_MIN_ZCR = 0.01
+
+def is_speech(samples, sample_rate, rms_threshold):
+    """Cheap energy/zero-crossing check on int16 PCM"""
+    frame = sample_rate * VAD_FRAME_MS // 1000
+    count = len(samples) // frame
+    if count == 0:
+        return False
+    
+    frames = samples[:count * frame].reshape(count, frame).astype(np.float32)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    voiced = frames[rms >= rms_threshold]
+    if len(voiced) < VAD_MIN_VOICED_FRAMES:
+        return False
+    
+    # Hum and DC offsets can be loud but barely cross zero
+    signs = np.signbit(voiced)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1])
+    return zcr >= VAD_MIN_ZCR
+
+class SpeechWorker(QObject):
+    """Base for the recording workers, each run on its own QThread"""
+    statusChanged = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+    
+    def __init__(self, recognizer, audio_queue):
+        super().__init__()
+        self.recognizer = recognizer
+        self.audio_queue = audio_queue
+        self.running = True
+    
+    def stop(self):
+        """Ask the worker loop to exit"""
+        self.running = False
+
+class RecorderWorker(SpeechWorker):
+    """Captures phrases and hands them to the transcriber"""
+    
+    def __init__(self, recognizer, calibration, audio_queue, encoder):
+        super().__init__(recognizer, audio_queue)
+        self.calibration = calibration
+        self.encoder = encoder
+    
+    def queue_audio(self, item):
+        """Queue a phrase for recognition, dropping the oldest one when full"""
+        # Only one phrase is added per call, so trimming once keeps the bound;
+        # a race with the transcriber's get() can cost at most this one phrase
+        if self.audio_queue.qsize() >= MAX_QUEUED_PHRASES:
+            try:
+                _, flac_future = self.audio_queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                flac_future.cancel()
+                self.statusChanged.emit("⚠️ Falling behind, dropped a phrase")
+        self.audio_queue.put(item)
+    
+    def run(self):
+        """Capture loop"""
+        try:
+            if not self.calibration.done():
+                self.statusChanged.emit("🎙️ Calibrating...")
+                self.calibration.result()
+                if self.running:
+                    self.statusChanged.emit("🎙️ Recording... Speak now!")
+            microphone = self.calibration.result()
+            
+            # Stopped while calibrating, don't open the stream at all
+            if not self.running:
+                return
+            
+            # Keep one PortAudio stream open for the whole session
+            with microphone as source:
+                while self.running:
+                    try:
+                        audio = self.recognizer.listen(source, timeout=2, phrase_time_limit=PHRASE_TIME_LIMIT)
+                        
+                        if not self.running:
+                            break
+                        
+                        if audio.sample_rate != SAMPLE_RATE or audio.sample_width != 2:
+                            audio = sr.AudioData(audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2), SAMPLE_RATE, 2)
+                        
+                        # Skip the network round-trip for coughs and background noise
+                        samples = np.frombuffer(audio.frame_data, dtype=np.int16)
+                        if not is_speech(samples, SAMPLE_RATE, self.recognizer.energy_threshold):
+                            self.statusChanged.emit("🎙️ Listening...")
+                            continue
+                        
+                        # Encode while the next phrase is captured and the previous one uploads
+                        self.queue_audio((audio, self.encoder.submit(encode_flac, audio)))
+                        
+                    except sr.WaitTimeoutError:
+                        if self.running:
+                            self.statusChanged.emit("🎙️ Listening...")
+                        continue
+        except Exception as e:
+            self.failed.emit(f"❌ Error: {str(e)}")
+        finally:
+            # Tell the transcriber there is nothing more to come; never evicts a phrase
+            self.audio_queue.put(None)
+            self.finished.emit()
+
+class TranscriberWorker(SpeechWorker):
+    """Sends captured phrases for recognition"""
+    textReady = pyqtSignal(str)
+    
+    def __init__(self, recognizer, audio_queue, language):
+        super().__init__(recognizer, audio_queue)
+        self.language = language
+    
+    def stop(self):
+        """Ask the worker loop to exit, waking it if it waits for audio"""
+        super().stop()
+        self.audio_queue.put(None)
+    
+    def run(self):
+        """Recognition loop"""
+        try:
+            while True:
+                item = self.audio_queue.get()
+                if item is None:
+                    break
+                audio, flac_future = item
+                
+                # Once stopped, just drain the queue up to the end marker
+                if not self.running:
+                    flac_future.cancel()
+                    continue
+                
+                try:
+                    self.statusChanged.emit("🔄 Processing...")
+                    
+                    text = recognize_google(audio, self.language, self.recognizer.operation_timeout, flac_future.result())
+                    
+                    if text.strip():
+                        self.textReady.emit(text)
+                    
+                    if self.running:
+                        self.statusChanged.emit("🎙️ Continue speaking...")
+                        
+                except sr.UnknownValueError:
+                    if self.running:
+                        self.statusChanged.emit("🎙️ Didn't catch that...")
+                    continue
+                except Exception as e:
+                    self.failed.emit(f"❌ Error: {str(e)}")
+                    break
+        finally:
+            self.finished.emit()
 
 class SpeechApp(QMainWindow):
-    # Signals for thread communication
+    # Status updates raised on the GUI thread
     status_signal = pyqtSignal(str)
-    text_signal = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
         
         # Initialize variables
         self.is_recording = False
+        self.workers = []
+        self.flac_encoder = ThreadPoolExecutor(max_workers=2)
+        self.drag_position = None
         self.settings_file = os.path.join(os.path.expanduser("~"), "speech_settings.json")
         self.settings = self.load_settings()
+        self.settings_dirty = False
         
         # Initialize speech components
         self.recognizer = sr.Recognizer()
         self.microphone = None
         self.init_microphone()
         
+        # Shadow copy of the text area, None after manual edits until re-read
+        self.transcript = ""
+        
+        # Word count is recomputed at most once per burst of edits
+        self.word_count_cache = 0
+        self.appending_text = False
+        self.word_count_timer = QTimer(self)
+        self.word_count_timer.setSingleShot(True)
+        self.word_count_timer.setInterval(150)
+        self.word_count_timer.timeout.connect(self.update_word_count)
+        
         # Setup UI
         self.init_ui()
         
         # Connect signals
         self.status_signal.connect(self.update_status)
-        self.text_signal.connect(self.add_text)
+        
+        # Workers post statuses here; the label picks up the latest at most every 100 ms
+        self.pending_status = None
+        self.last_status = self.status_label.text()
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(100)
+        self.status_timer.timeout.connect(self.flush_status)
         
         print("✅ App initialized successfully")
         
@@ -48,9 +427,10 @@ class SpeechApp(QMainWindow):
         
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    saved = json.load(f)
-                    return {**defaults, **saved}
+                with open(self.settings_file, 'rb') as f:
+                    data = f.read()
+                saved = orjson.loads(data) if orjson else json.loads(data)
+                return {**defaults, **saved}
         except:
             pass
         
@@ -58,9 +438,22 @@ class SpeechApp(QMainWindow):
     
     def save_settings(self):
         """Save settings safely"""
+        if not self.settings_dirty:
+            return True
+        
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            if orjson:
+                data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.settings, indent=2).encode('utf-8')
+            
+            # Write a temp file and swap it in so a crash never leaves a half-written file
+            tmp_file = self.settings_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.settings_file)
+            
+            self.settings_dirty = False
             print("✅ Settings saved")
             return True
         except Exception as e:
@@ -69,14 +462,33 @@ class SpeechApp(QMainWindow):
     
     def init_microphone(self):
         """Initialize microphone"""
+        self.calibration = None
         try:
-            self.microphone = sr.Microphone()
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
-            print("🎤 Microphone ready")
+            self.microphone = sr.Microphone(sample_rate=SAMPLE_RATE, chunk_size=CHUNK_SIZE)
+            # Calibrate in the background so the window can paint right away.
+            # A daemon thread, so a hung audio device can't block exit
+            self.calibration = Future()
+            threading.Thread(target=self.calibrate_microphone, daemon=True).start()
         except Exception as e:
             print(f"🎤 Microphone error: {e}")
     
+    def calibrate_microphone(self):
+        """Adjust for ambient noise, then publish the microphone to record from"""
+        try:
+            try:
+                with self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            except Exception:
+                # Device rejected 16 kHz, capture at its native rate and resample later
+                self.microphone = sr.Microphone(chunk_size=CHUNK_SIZE)
+                with self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            print("🎤 Microphone ready")
+        except Exception as e:
+            print(f"🎤 Microphone calibration error: {e}")
+        finally:
+            self.calibration.set_result(self.microphone)
+    
     def init_ui(self):
         """Create the user interface"""
         self.setWindowTitle("🎙️ Speech AI")
@@ -84,17 +496,7 @@ class SpeechApp(QMainWindow):
         self.setWindowFlags(Qt.FramelessWindowHint)
         
         # Set dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background: #1e1e1e;
-                border-radius: 12px;
-            }
-            QWidget {
-                background: #1e1e1e;
-                color: white;
-                font-family: 'Segoe UI';
-            }
-        """)
+        QApplication.instance().setStyleSheet(APP_STYLESHEET)
         
         # Central widget
         central = QWidget()
@@ -108,37 +510,16 @@ class SpeechApp(QMainWindow):
         
         # Status
         self.status_label = QLabel("Ready to record")
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background: rgba(0, 123, 255, 0.2);
-                border: 1px solid #007bff;
-                border-radius: 8px;
-                padding: 10px;
-                color: #007bff;
-                font-weight: 500;
-            }
-        """)
         layout.addWidget(self.status_label)
         
         # Record button
         self.record_btn = QPushButton("🎙️")
+        self.record_btn.setObjectName("recordBtn")
+        self.record_btn.setProperty("recording", False)
         self.record_btn.setFixedSize(70, 70)
         self.record_btn.clicked.connect(self.toggle_recording)
-        self.record_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                           stop:0 #28a745, stop:1 #20c997);
-                border: none;
-                border-radius: 35px;
-                color: white;
-                font-size: 28px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                           stop:0 #218838, stop:1 #1c7431);
-            }
-        """)
         
         # Center record button
         btn_container = QWidget()
@@ -153,37 +534,22 @@ class SpeechApp(QMainWindow):
         controls_layout = QHBoxLayout(controls)
         
         self.stop_btn = QPushButton("⏹️")
+        self.stop_btn.setObjectName("stopBtn")
         self.stop_btn.setFixedSize(45, 35)
         self.stop_btn.setEnabled(False)
         self.stop_btn.clicked.connect(self.stop_recording)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background: #6c757d;
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-size: 14px;
-            }
-            QPushButton:hover:enabled {
-                background: #5a6268;
-            }
-            QPushButton:disabled {
-                background: #495057;
-                color: #adb5bd;
-            }
-        """)
         controls_layout.addWidget(self.stop_btn)
         
         clear_btn = QPushButton("🗑️")
+        clear_btn.setObjectName("toolBtn")
         clear_btn.setFixedSize(45, 35)
         clear_btn.clicked.connect(self.clear_text)
-        clear_btn.setStyleSheet(self.get_button_style())
         controls_layout.addWidget(clear_btn)
         
         copy_btn = QPushButton("📋")
+        copy_btn.setObjectName("toolBtn")
         copy_btn.setFixedSize(45, 35)
         copy_btn.clicked.connect(self.copy_text)
-        copy_btn.setStyleSheet(self.get_button_style())
         controls_layout.addWidget(copy_btn)
         
         controls_layout.addStretch()
@@ -191,21 +557,9 @@ class SpeechApp(QMainWindow):
         
         # Text area
         self.text_area = QTextEdit()
+        self.text_area.setObjectName("textArea")
         self.text_area.setPlaceholderText("Transcribed text appears here...")
-        self.text_area.setStyleSheet("""
-            QTextEdit {
-                background: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 12px;
-                color: white;
-                font-size: 12px;
-            }
-            QTextEdit:focus {
-                border: 1px solid #007bff;
-            }
-        """)
-        self.text_area.textChanged.connect(self.update_word_count)
+        self.text_area.textChanged.connect(self.on_text_changed)
         layout.addWidget(self.text_area)
         
         # Bottom bar
@@ -213,16 +567,16 @@ class SpeechApp(QMainWindow):
         bottom_layout = QHBoxLayout(bottom)
         
         self.word_count = QLabel("0 words")
-        self.word_count.setStyleSheet("color: #adb5bd; font-size: 11px;")
+        self.word_count.setObjectName("wordCount")
         bottom_layout.addWidget(self.word_count)
         
         bottom_layout.addStretch()
         
         # Settings button
         settings_btn = QPushButton("⚙️")
+        settings_btn.setObjectName("smallBtn")
         settings_btn.setFixedSize(30, 30)
         settings_btn.clicked.connect(self.show_settings)
-        settings_btn.setStyleSheet(self.get_small_button_style())
         bottom_layout.addWidget(settings_btn)
         
         layout.addWidget(bottom)
@@ -242,68 +596,26 @@ class SpeechApp(QMainWindow):
         title_layout.setContentsMargins(0, 0, 0, 0)
         
         title = QLabel("🎙️ Speech AI")
-        title.setStyleSheet("font-size: 14px; font-weight: bold; color: white;")
+        title.setObjectName("titleLabel")
         title_layout.addWidget(title)
         
         title_layout.addStretch()
         
         # Window controls
         min_btn = QPushButton("—")
+        min_btn.setObjectName("smallBtn")
         min_btn.setFixedSize(25, 25)
         min_btn.clicked.connect(self.showMinimized)
-        min_btn.setStyleSheet(self.get_small_button_style())
         title_layout.addWidget(min_btn)
         
         close_btn = QPushButton("✕")
+        close_btn.setObjectName("closeBtn")
         close_btn.setFixedSize(25, 25)
         close_btn.clicked.connect(self.close)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background: #dc3545;
-                border: none;
-                border-radius: 12px;
-                color: white;
-                font-size: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #c82333;
-            }
-        """)
         title_layout.addWidget(close_btn)
         
         layout.addWidget(title_bar)
     
-    def get_button_style(self):
-        """Standard button style"""
-        return """
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                color: white;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.2);
-            }
-        """
-    
-    def get_small_button_style(self):
-        """Small button style"""
-        return """
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 12px;
-                color: white;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.2);
-            }
-        """
-    
     def toggle_recording(self):
         """Toggle recording state"""
         if self.is_recording:
@@ -317,121 +629,155 @@ class SpeechApp(QMainWindow):
             self.status_signal.emit("❌ Microphone not available")
             return
         
+        if any(thread.isRunning() for _, thread in self.workers):
+            self.status_signal.emit("⏳ Finishing previous recording...")
+            return
+        
         self.is_recording = True
         self.record_btn.setText("🔴")
-        self.record_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                           stop:0 #dc3545, stop:1 #c82333);
-                border: none;
-                border-radius: 35px;
-                color: white;
-                font-size: 28px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                           stop:0 #c82333, stop:1 #bd2130);
-            }
-        """)
+        self.set_record_button_state(True)
         self.stop_btn.setEnabled(True)
         self.status_signal.emit("🎙️ Recording... Speak now!")
         
-        # Start recording in thread
-        threading.Thread(target=self.record_worker, daemon=True).start()
+        # Capture and recognition run on separate threads so the next
+        # phrase is recorded while the previous one is being transcribed
+        audio_queue = queue.Queue()
+        recorder = RecorderWorker(self.recognizer, self.calibration, audio_queue, self.flac_encoder)
+        transcriber = TranscriberWorker(self.recognizer, audio_queue, self.settings.get('language', 'en-US'))
+        transcriber.textReady.connect(self.on_text_recognized, Qt.QueuedConnection)
+        
+        self.workers = []
+        self.start_worker(recorder)
+        self.start_worker(transcriber)
+    
+    def start_worker(self, worker):
+        """Run a worker on its own QThread"""
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        worker.statusChanged.connect(self.post_status, Qt.QueuedConnection)
+        worker.failed.connect(self.on_recording_failed, Qt.QueuedConnection)
+        # The GUI thread may be blocked in wait() on close, so quit directly
+        worker.finished.connect(thread.quit, Qt.DirectConnection)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self.on_worker_finished)
+        thread.started.connect(worker.run)
+        self.workers.append((worker, thread))
+        thread.start()
+    
+    def on_worker_finished(self):
+        """Forget a worker whose thread has ended"""
+        thread = self.sender()
+        self.workers = [(w, t) for w, t in self.workers if t is not thread]
     
     def stop_recording(self):
         """Stop recording"""
         self.is_recording = False
+        for worker, _ in self.workers:
+            worker.stop()
+        
         self.record_btn.setText("🎙️")
-        self.record_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                           stop:0 #28a745, stop:1 #20c997);
-                border: none;
-                border-radius: 35px;
-                color: white;
-                font-size: 28px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                           stop:0 #218838, stop:1 #1c7431);
-            }
-        """)
+        self.set_record_button_state(False)
         self.stop_btn.setEnabled(False)
         self.status_signal.emit("✅ Recording stopped")
     
-    def record_worker(self):
-        """Recording worker thread"""
-        while self.is_recording:
-            try:
-                with self.microphone as source:
-                    audio = self.recognizer.listen(source, timeout=2, phrase_time_limit=8)
-                
-                if not self.is_recording:
-                    break
-                
-                self.status_signal.emit("🔄 Processing...")
-                
-                text = self.recognizer.recognize_google(audio, language=self.settings.get('language', 'en-US'))
-                
-                if text.strip():
-                    self.text_signal.emit(text)
-                    
-                    if self.settings.get('auto_copy'):
-                        QTimer.singleShot(100, self.copy_text)
-                
-                if self.is_recording:
-                    self.status_signal.emit("🎙️ Continue speaking...")
-                    
-            except sr.WaitTimeoutError:
-                if self.is_recording:
-                    self.status_signal.emit("🎙️ Listening...")
-                continue
-            except sr.UnknownValueError:
-                if self.is_recording:
-                    self.status_signal.emit("🎙️ Didn't catch that...")
-                continue
-            except Exception as e:
-                self.status_signal.emit(f"❌ Error: {str(e)}")
-                break
-        
-        # Reset UI when done
-        QTimer.singleShot(0, self.stop_recording)
+    def on_recording_failed(self, message):
+        """Stop recording and report a worker error"""
+        if self.is_recording:
+            self.stop_recording()
+        self.status_signal.emit(message)
+    
+    def set_record_button_state(self, recording):
+        """Switch record button look without re-parsing its stylesheet"""
+        self.record_btn.setProperty("recording", recording)
+        self.record_btn.style().unpolish(self.record_btn)
+        self.record_btn.style().polish(self.record_btn)
     
     def clear_text(self):
         """Clear text area"""
         self.text_area.clear()
+        self.transcript = ""
         self.status_signal.emit("🗑️ Text cleared")
     
     def copy_text(self):
         """Copy text to clipboard"""
-        text = self.text_area.toPlainText()
+        text = self.get_transcript()
         if text.strip():
-            pyperclip.copy(text)
+            QApplication.clipboard().setText(text)
             self.status_signal.emit("📋 Copied!")
         else:
             self.status_signal.emit("❌ No text to copy")
     
+    def post_status(self, message):
+        """Hold a worker status for the next status refresh"""
+        self.pending_status = message
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+    
+    def flush_status(self):
+        """Show the latest status posted by the workers"""
+        message, self.pending_status = self.pending_status, None
+        if message is not None:
+            self.set_status_text(message)
+    
     def update_status(self, message):
         """Update status label"""
-        self.status_label.setText(message)
+        # Newer than anything the workers posted before it
+        self.pending_status = None
+        self.set_status_text(message)
+    
+    def set_status_text(self, message):
+        """Set status label text, skipping repaints for repeated messages"""
+        if message != self.last_status:
+            self.last_status = message
+            self.status_label.setText(message)
+    
+    def on_text_recognized(self, text):
+        """Append a recognized phrase and auto-copy it"""
+        self.add_text(text)
+        if self.settings.get('auto_copy'):
+            self.copy_text()
     
     def add_text(self, text):
         """Add text to text area"""
-        current = self.text_area.toPlainText()
-        new_text = f"{current} {text}".strip() if current else text
-        self.text_area.setPlainText(new_text)
-        
-        # Move cursor to end
+        # Insert at the end so only the last block is laid out again
         cursor = self.text_area.textCursor()
         cursor.movePosition(QTextCursor.End)
+        separator = "" if self.text_area.document().isEmpty() else " "
+        
+        self.appending_text = True
+        try:
+            cursor.insertText(separator + text)
+        finally:
+            self.appending_text = False
+        
+        if self.transcript is not None:
+            self.transcript += separator + text
+        
         self.text_area.setTextCursor(cursor)
+        self.text_area.ensureCursorVisible()
+        
+        # Count only the new words unless a full recount is already pending
+        if not self.word_count_timer.isActive():
+            self.word_count_cache += len(text.split())
+            self.word_count.setText(f"{self.word_count_cache} words")
+    
+    def on_text_changed(self):
+        """Schedule a word recount after edits"""
+        if not self.appending_text:
+            self.transcript = None
+            self.word_count_timer.start()
+    
+    def get_transcript(self):
+        """Get text area contents, re-reading the document only after edits"""
+        if self.transcript is None:
+            self.transcript = self.text_area.toPlainText()
+        return self.transcript
     
     def update_word_count(self):
         """Update word count"""
-        text = self.text_area.toPlainText()
-        words = len(text.split()) if text.strip() else 0
-        self.word_count.setText(f"{words} words")
+        text = self.get_transcript()
+        self.word_count_cache = len(text.split()) if text.strip() else 0
+        self.word_count.setText(f"{self.word_count_cache} words")
     
     def show_settings(self):
         """Show settings dialog"""
@@ -444,7 +790,9 @@ class SpeechApp(QMainWindow):
                 old_on_top = self.settings.get('always_on_top', False)
                 new_on_top = new_settings.get('always_on_top', False)
                 
-                self.settings.update(new_settings)
+                if any(self.settings.get(key) != value for key, value in new_settings.items()):
+                    self.settings.update(new_settings)
+                    self.settings_dirty = True
                 
                 if self.save_settings():
                     self.status_signal.emit("⚙️ Settings saved!")
@@ -463,26 +811,48 @@ class SpeechApp(QMainWindow):
     
     def center_window(self):
         """Center window on screen"""
-        screen = QDesktopWidget().screenGeometry()
-        size = self.geometry()
-        self.move((screen.width() - size.width()) // 2, (screen.height() - size.height()) // 2)
+        # Available geometry excludes taskbars and docks
+        screen = QGuiApplication.primaryScreen().availableGeometry()
+        self.move(screen.center() - self.rect().center())
     
     def mousePressEvent(self, event):
         """Enable dragging"""
         if event.button() == Qt.LeftButton:
-            self.drag_position = event.globalPos()
+            # Let the window manager drag natively (Qt 5.15+)
+            handle = self.windowHandle()
+            if handle is not None and hasattr(handle, 'startSystemMove') and handle.startSystemMove():
+                self.drag_position = None
+            else:
+                self.drag_position = event.globalPos()
     
     def mouseMoveEvent(self, event):
-        """Handle dragging"""
-        if event.buttons() == Qt.LeftButton and hasattr(self, 'drag_position'):
+        """Handle dragging when a system move is not available"""
+        if event.buttons() == Qt.LeftButton and self.drag_position is not None:
             delta = QPoint(event.globalPos() - self.drag_position)
             self.move(self.x() + delta.x(), self.y() + delta.y())
             self.drag_position = event.globalPos()
     
     def closeEvent(self, event):
         """Handle app close"""
-        self.is_recording = False
+        if self.is_recording:
+            self.stop_recording()
         self.save_settings()
+        
+        # Give the workers a moment to wind down before Qt tears down
+        self.hide()
+        for worker, thread in self.workers:
+            worker.stop()
+            thread.quit()
+        
+        # One shared budget for all threads, not one per thread
+        deadline = QDeadlineTimer(WORKER_SHUTDOWN_MS)
+        for worker, thread in self.workers:
+            if not thread.wait(deadline):
+                # Still blocked on the device or network; detach it so Qt doesn't
+                # destroy a running QThread, and let it end with the process
+                thread.setParent(None)
+                sip.transferto(thread, None)
+        self.flac_encoder.shutdown(wait=False, cancel_futures=True)
         event.accept()
 
 class SettingsDialog(QDialog):
@@ -499,37 +869,8 @@ class SettingsDialog(QDialog):
         self.setFixedSize(300, 200)
         self.setModal(True)
         
-        self.setStyleSheet("""
-            QDialog {
-                background: #2d2d2d;
-                color: white;
-            }
-            QCheckBox {
-                color: white;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #666;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background: #007bff;
-                border: 2px solid #007bff;
-            }
-            QPushButton {
-                background: #007bff;
-                border: none;
-                border-radius: 6px;
-                color: white;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #0056b3;
-            }
-        """)
+        # Styled by APP_STYLESHEET
+        self.setObjectName("settingsDialog")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
@@ -537,7 +878,7 @@ class SettingsDialog(QDialog):
         
         # Title
         title = QLabel("⚙️ Settings")
-        title.setStyleSheet("font-size: 14px; font-weight: bold;")
+        title.setObjectName("dialogTitle")
         layout.addWidget(title)
         
         # Settings
@@ -583,26 +924,39 @@ class SettingsDialog(QDialog):
 def main():
     """Main function"""
     try:
-        app = QApplication(sys.argv)
-        app.setStyle('Fusion')
+        # Overlap the speech imports with Qt platform plugin loading
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            preload = pool.submit(import_speech_modules)
+            
+            app = QApplication(sys.argv)
+            app.setStyle('Fusion')
+            
+            pixmap = QPixmap(360, 450)
+            pixmap.fill(QColor("#1e1e1e"))
+            splash = QSplashScreen(pixmap)
+            splash.showMessage("🎙️ Loading Speech AI...", Qt.AlignCenter, Qt.white)
+            splash.show()
+            app.processEvents()
         
         # Check for required modules
         try:
-            import speech_recognition
-            import pyaudio
-            import pyperclip
+            preload.result()
         except ImportError as e:
+            splash.close()
             QMessageBox.critical(None, "Missing Module", f"Please install required module:\n\n{e}\n\nRun: pip install {str(e).split()[-1]}")
             return
         
         window = SpeechApp()
         window.show()
+        splash.finish(window)
         
         print("🚀 Speech AI started!")
         sys.exit(app.exec_())
         
     except Exception as e:
         print(f"❌ Startup error: {e}")
+        if 'splash' in locals():
+            splash.close()
         if 'app' in locals():
             QMessageBox.critical(None, "Error", f"Failed to start:\n\n{e}")
 